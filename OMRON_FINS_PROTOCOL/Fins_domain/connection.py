@@ -8,9 +8,6 @@ from abc import ABCMeta
 from typing import List, Union, Any
 
 
-from OMRON_FINS_PROTOCOL.Fins_domain.frames import FinsCommandFrame
-
-
 __version__ = "0.1.0"
 
 # (metaclass=ABCMeta)
@@ -88,7 +85,7 @@ class FinsConnection(metaclass=ABCMeta):
                       service_id: bytes = b'\x00', icf: bytes = b'\x80', 
                       gct: bytes = b'\x02', rsv: bytes = b'\x00') -> bytes:
         """
-        Build a complete FINS command frame using the FinsCommandFrame class.
+        Build a complete FINS command frame (header + command code + text).
         
         Args:
             command_code: FINS command code
@@ -101,27 +98,16 @@ class FinsConnection(metaclass=ABCMeta):
         Returns:
             Complete command frame as bytes
         """
-        frame = FinsCommandFrame()
-        
-        # Set header fields
-        frame.header.set(
-            icf=icf,
-            rsv=rsv, 
-            gct=gct,
-            dna=self.dest_net_add.to_bytes(1, 'big'),
-            da1=self.dest_node_add.to_bytes(1, 'big'),
-            da2=self.dest_unit_add.to_bytes(1, 'big'),
-            sna=self.srce_net_add.to_bytes(1, 'big'),
-            sa1=self.srce_node_add.to_bytes(1, 'big'),
-            sa2=self.srce_unit_add.to_bytes(1, 'big'),
-            sid=service_id
-        )
-        # print("my program Fins header ", frame.header)
-        # Set command data
-        frame.command_code = command_code
-        frame.text = text
-        
-        return frame.bytes()
+        # Same layout as FinsCommandFrame.bytes(), joined in one step without
+        # building the intermediate frame/header objects on every request
+        return b''.join((
+            icf, rsv, gct,
+            bytes((self.dest_net_add, self.dest_node_add, self.dest_unit_add,
+                   self.srce_net_add, self.srce_node_add, self.srce_unit_add)),
+            service_id,
+            command_code,
+            text
+        ))
     
 # if __name__ == "__main__":
 #     finscheck = FinsConnection("192.168.137.2")
\ No newline at end of file
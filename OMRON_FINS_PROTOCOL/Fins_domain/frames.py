@@ -60,11 +60,10 @@ class FinsHeader:
         Returns:
             Header as bytes
         """
-        response = (self.icf + self.rsv + self.gct +
-                    self.dna + self.da1 + self.da2 +
-                    self.sna + self.sa1 + self.sa2 +
-                    self.sid)
-        return response
+        return b''.join((self.icf, self.rsv, self.gct,
+                         self.dna, self.da1, self.da2,
+                         self.sna, self.sa1, self.sa2,
+                         self.sid))
     
     def from_bytes(self, data: bytes) -> None:
         """
@@ -107,7 +106,7 @@ class FinsCommandFrame:
         Returns:
             Complete command frame as bytes
         """
-        return self.header.bytes() + self.command_code + self.text
+        return b''.join((self.header.bytes(), self.command_code, self.text))
     
     def from_bytes(self, data: bytes) -> None:
         """
@@ -144,7 +143,7 @@ class FinsResponseFrame:
         Returns:
             Complete response frame as bytes
         """
-        return self.header.bytes() + self.command_code + self.end_code + self.text
+        return b''.join((self.header.bytes(), self.command_code, self.end_code, self.text))
     
     def from_bytes(self, data: bytes) -> None:
         """
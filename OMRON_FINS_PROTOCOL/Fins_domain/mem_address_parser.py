@@ -138,7 +138,7 @@ class FinsAddressParser:
         else:
             memory_type_int = memory_type
         
-        word_address = int.from_bytes(bytes(moffset), 'big')
+        word_address = (moffset[0] << 8) | moffset[1]
         
         return {
             'address_type': 'bit',
@@ -176,7 +176,7 @@ class FinsAddressParser:
         else:
             memory_type_int = memory_type
         
-        word_address = int.from_bytes(bytes(moffset), 'big')
+        word_address = (moffset[0] << 8) | moffset[1]
         
         return {
             'address_type': 'word',
@@ -6,8 +6,10 @@ Enhanced with comprehensive error handling, logging, type hints, and optimized p
 """
 
 import asyncio
+import itertools
 import logging
 import socket
+import struct
 from datetime import datetime
 from typing import Optional, Tuple, Union, Dict, List, Any, Callable
 
@@ -39,6 +41,59 @@ MAX_READ_SIZE = 65535  # Maximum total read size
 MAX_RETRIES = 3
 CONNECTION_CHECK_INTERVAL = 30  # seconds
 
+# MEMORY_AREA_READ (0x0101) command data: command code (2 bytes) + memory area code (1 byte)
+# + address (2 bytes) + bit position (1 byte) + read size (2 bytes)
+READ_COMMAND_STRUCT = struct.Struct('>2sBHBH')
+# MULTIPLE_MEMORY_AREA_READ (0x0104) record per address: memory area code (1 byte)
+# + address (2 bytes) + bit position (1 byte)
+MULTIPLE_READ_RECORD_STRUCT = struct.Struct('>BHB')
+# Byte offset of the service ID (SID) in the 10-byte FINS header
+SERVICE_ID_OFFSET = 9
+
+
+class FinsDatagramProtocol(asyncio.DatagramProtocol):
+    """
+    Datagram protocol that dispatches FINS responses to pending requests.
+
+    Responses are matched to requests by the service ID (SID) echoed in the
+    response header, so several requests can be in flight on one transport.
+
+    Attributes:
+        pending (Dict[int, asyncio.Future]): Outstanding requests keyed by SID
+    """
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self.logger = logger
+        self.pending: Dict[int, asyncio.Future] = {}
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        """Resolve the pending request whose SID matches the response."""
+        if len(data) <= SERVICE_ID_OFFSET:
+            self.logger.warning(f"Ignoring short datagram from {addr} ({len(data)} bytes)")
+            return
+
+        future = self.pending.pop(data[SERVICE_ID_OFFSET], None)
+        if future is None or future.done():
+            self.logger.debug(f"Ignoring unexpected response with SID {data[SERVICE_ID_OFFSET]} from {addr}")
+            return
+        future.set_result(data)
+
+    def error_received(self, exc: Exception) -> None:
+        """Fail all pending requests on a socket error."""
+        self._fail_pending(exc)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        """Fail all pending requests when the transport closes."""
+        self._fail_pending(exc or FinsConnectionError("UDP transport closed"))
+
+    def _fail_pending(self, exc: Exception) -> None:
+        # Cleared in place - requests waiting on a busy SID hold a reference to this dict
+        futures = list(self.pending.values())
+        self.pending.clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(exc)
+
 
 class FinsUdpConnection(FinsConnection):
     """
@@ -113,8 +168,11 @@ class FinsUdpConnection(FinsConnection):
 
         self.timeout = timeout
         self.debug = debug
-        self.socket: Optional[socket.socket] = None
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.protocol: Optional[FinsDatagramProtocol] = None
         self.connected = False
+        # Rolling service IDs for requests that are in flight together
+        self._service_ids = itertools.cycle(range(256))
         self.last_activity = datetime.now()
 
         # Initialize logger
@@ -141,40 +199,55 @@ class FinsUdpConnection(FinsConnection):
 
     async def connect(self) -> None:
         """
-        Initialize UDP socket asynchronously with enhanced error handling.
+        Initialize the UDP datagram endpoint asynchronously with enhanced error handling.
 
         Raises:
             FinsConnectionError: If socket creation fails
         """
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.socket.settimeout(self.timeout)
+            loop = asyncio.get_running_loop()
+            self.transport, self.protocol = await loop.create_datagram_endpoint(
+                lambda: FinsDatagramProtocol(self.logger),
+                remote_addr=self.addr
+            )
             self.connected = True
             self.last_activity = datetime.now()
             self.logger.info("UDP socket initialized successfully")
 
         except socket.error as e:
             self.connected = False
-            if self.socket:
-                self.socket.close()
-                self.socket = None
+            self.transport = None
+            self.protocol = None
             error_msg = f"Failed to create UDP socket: {e}"
             self.logger.error(error_msg)
             raise FinsConnectionError(error_msg) from e
 
     async def disconnect(self) -> None:
-        """Close the UDP socket asynchronously with proper cleanup."""
-        if self.socket:
+        """Close the UDP transport asynchronously with proper cleanup."""
+        if self.transport:
             try:
-                self.socket.close()
+                self.transport.close()
                 self.logger.debug("UDP socket closed")
             except socket.error as e:
                 self.logger.warning(f"Error closing socket: {e}")
             finally:
-                self.socket = None
+                self.transport = None
+                self.protocol = None
                 self.connected = False
                 self.last_activity = datetime.now()
 
+    def next_service_id(self) -> bytes:
+        """
+        Allocate the next service ID (SID) for a command frame.
+
+        Requests that are in flight together on this connection need distinct
+        SIDs so their responses can be told apart.
+
+        Returns:
+            Service ID as a single byte
+        """
+        return next(self._service_ids).to_bytes(1, 'big')
+
     def _check_connection_health(self) -> bool:
         """
         Check if connection is healthy based on activity timestamp.
@@ -188,6 +261,50 @@ class FinsUdpConnection(FinsConnection):
         time_since_activity = (datetime.now() - self.last_activity).total_seconds()
         return time_since_activity < CONNECTION_CHECK_INTERVAL
 
+    async def _raw_request(self, fins_command_frame: bytes) -> bytes:
+        """
+        Send a FINS command frame once and return the raw response.
+
+        Low-level fast path without retries or logging, for callers that
+        handle failures themselves (e.g. tight serial read loops).
+
+        The response is matched by the frame's service ID, so requests with
+        distinct SIDs run concurrently; a request reusing the SID of one still
+        in flight waits for that one to finish first.
+
+        Args:
+            fins_command_frame: Complete FINS command frame
+
+        Returns:
+            Response frame bytes
+
+        Raises:
+            FinsConnectionError: If the socket is not initialized
+            socket.timeout: If no response arrives within the timeout
+            socket.error: If the socket operation fails
+        """
+        if not self.connected or not self.transport:
+            raise FinsConnectionError("UDP socket not initialized")
+
+        pending = self.protocol.pending
+        sid = fins_command_frame[SERVICE_ID_OFFSET]
+        while sid in pending:
+            await asyncio.wait([pending[sid]])
+
+        future = asyncio.get_running_loop().create_future()
+        pending[sid] = future
+        try:
+            self.transport.sendto(fins_command_frame)
+            response_data = await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            raise socket.timeout(f"No response for SID {sid} within {self.timeout}s") from None
+        finally:
+            if pending.get(sid) is future:
+                del pending[sid]
+
+        self.last_activity = datetime.now()
+        return response_data
+
     async def execute_fins_command_frame(self, fins_command_frame: bytes) -> bytes:
         """
         Execute a FINS command frame over UDP asynchronously with retry logic.
@@ -202,19 +319,15 @@ class FinsUdpConnection(FinsConnection):
             FinsConnectionError: If communication fails after retries
             FinsTimeoutError: If response timeout occurs
         """
-        if not self.connected or not self.socket:
+        if not self.connected or not self.transport:
             raise FinsConnectionError("UDP socket not initialized")
 
         last_exception = None
         for attempt in range(MAX_RETRIES):
             try:
-                self.socket.sendto(fins_command_frame, self.addr)
-                self.logger.debug(f"Sent command frame to {self.addr}")
-
-                # Receive response with timeout
-                response_data = self.socket.recv(4096)
-                self.last_activity = datetime.now()
-                self.logger.debug(f"Received response ({len(response_data)} bytes)")
+                # Send and receive response with timeout
+                response_data = await self._raw_request(fins_command_frame)
+                self.logger.debug(f"Received response from {self.addr} ({len(response_data)} bytes)")
                 return response_data
 
             except socket.timeout as e:
@@ -236,6 +349,59 @@ class FinsUdpConnection(FinsConnection):
         # This should never be reached, but just in case
         raise FinsConnectionError(f"Failed to execute command after {MAX_RETRIES} attempts") from last_exception
 
+    async def execute_fins_command_frames(self, fins_command_frames: List[bytes]) -> List[bytes]:
+        """
+        Send several FINS command frames back-to-back and return their responses.
+
+        All frames are sent in one tight loop before any response is awaited,
+        so the requests go out as a single burst. Each frame needs its own
+        service ID; responses are returned in the order of the frames. There
+        are no retries - a missing response fails the whole burst.
+
+        Args:
+            fins_command_frames: Complete FINS command frames with distinct service IDs
+
+        Returns:
+            Response frame bytes, one per command frame
+
+        Raises:
+            FinsConnectionError: If the socket is not initialized or a send fails
+            FinsTimeoutError: If any response does not arrive within the timeout
+            FinsDataError: If two frames share a service ID
+        """
+        if not self.connected or not self.transport:
+            raise FinsConnectionError("UDP socket not initialized")
+
+        sids = [frame[SERVICE_ID_OFFSET] for frame in fins_command_frames]
+        if len(set(sids)) != len(sids):
+            raise FinsDataError("Burst frames must have distinct service IDs", error_code="DUPLICATE_SERVICE_ID")
+
+        # Wait until none of the burst's SIDs is in flight, re-checking all of them after
+        # every wait, then register the whole burst with no await in between
+        pending = self.protocol.pending
+        while busy := [pending[sid] for sid in sids if sid in pending]:
+            await asyncio.wait(busy)
+
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in sids]
+        pending.update(zip(sids, futures))
+        try:
+            sendto = self.transport.sendto
+            for frame in fins_command_frames:
+                sendto(frame)
+            responses = await asyncio.wait_for(asyncio.gather(*futures), self.timeout)
+        except asyncio.TimeoutError:
+            raise FinsTimeoutError(f"No response for {len(sids)} burst frames within {self.timeout}s") from None
+        except socket.error as e:
+            raise FinsConnectionError(f"UDP burst send failed: {e}") from e
+        finally:
+            for sid, future in zip(sids, futures):
+                if pending.get(sid) is future:
+                    del pending[sid]
+
+        self.last_activity = datetime.now()
+        return responses
+
     def _parse_response(self, response_data: bytes) -> FinsResponseFrame:
         """
         Parse response data using FinsResponseFrame.
@@ -330,7 +496,7 @@ class FinsUdpConnection(FinsConnection):
         self,
         memory_area_code: str,
         data_type: str = 'INT16',
-        service_id: int = 0
+        service_id: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Read data from PLC memory area using FINS command codes.
@@ -338,7 +504,7 @@ class FinsUdpConnection(FinsConnection):
         Args:
             memory_area_code: Memory area identifier (e.g., 'D1000', 'W100', 'A50.1')
             data_type: Data type to read (default 'INT16')
-            service_id: Service ID for the command
+            service_id: Service ID for the command (allocated from the connection if None)
 
         Returns:
             Dictionary with status, message, and data
@@ -396,7 +562,7 @@ class FinsUdpConnection(FinsConnection):
         info: Dict,
         chunk_offset: int,
         chunk_size: int,
-        service_id: int,
+        service_id: Optional[int],
         final_result: Dict
     ) -> Optional[bytes]:
         """Read a single chunk of data."""
@@ -454,22 +620,20 @@ class FinsUdpConnection(FinsConnection):
         self,
         info: Dict,
         read_size: int,
-        service_id: int
+        service_id: Optional[int]
     ) -> bytes:
         """Build FINS command frame for memory read."""
-        sid = service_id.to_bytes(1, 'big')
-
-        # Create command frame
-        finsary = bytearray(8)
-        finsary[0:2] = self.command_codes.MEMORY_AREA_READ
-        finsary[2] = info['memory_type_code']
-        finsary[3:5] = info['offset_bytes']
-        if info['address_type'] == 'bit':
-            finsary[5] = info['bit_number']
-        else:
-            finsary[5] = 0x00
-        finsary[6] = (read_size >> 8) & 0xFF  # High byte
-        finsary[7] = read_size & 0xFF        # Low byte
+        sid = self.next_service_id() if service_id is None else service_id.to_bytes(1, 'big')
+
+        # Create command frame in a single pack
+        bit_number = info['bit_number'] if info['address_type'] == 'bit' else 0x00
+        finsary = READ_COMMAND_STRUCT.pack(
+            self.command_codes.MEMORY_AREA_READ,
+            info['memory_type_code'],
+            info['word_address'],
+            bit_number,
+            read_size
+        )
 
         # Build FINS command frame
         return self.fins_command_frame(command_code=finsary, service_id=sid)
@@ -556,7 +720,7 @@ class FinsUdpConnection(FinsConnection):
         memory_area_code: str,
         data_type: str = 'INT16',
         no_items_to_read: int = 1,
-        service_id: int = 0
+        service_id: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Read multiple consecutive data items from PLC memory area.
@@ -565,7 +729,7 @@ class FinsUdpConnection(FinsConnection):
             memory_area_code: Memory area identifier (starting address)
             data_type: Data type to read (default 'INT16')
             no_items_to_read: Number of items to read
-            service_id: Service ID for the command
+            service_id: Service ID for the command (allocated from the connection if None)
 
         Returns:
             Dictionary with status, message, and data (list of converted values)
@@ -689,7 +853,7 @@ class FinsUdpConnection(FinsConnection):
     async def multiple_read(
         self,
         dict_memory_codes: Dict[str, str],
-        service_id: int = 0
+        service_id: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Read from multiple non-consecutive memory areas using FINS MULTIPLE_MEMORY_AREA_READ command.
@@ -698,7 +862,7 @@ class FinsUdpConnection(FinsConnection):
         Args:
             dict_memory_codes: Dictionary with memory codes as keys and data types as values
                               e.g., {"D0": "INT16", "W100": "INT32", "A50.1": "BOOL"}
-            service_id: Service ID for the command
+            service_id: Service ID for the command (allocated from the connection if None)
 
         Returns:
             Dictionary with status, message, and data (updated dict with 'value' key for each entry)
@@ -721,16 +885,17 @@ class FinsUdpConnection(FinsConnection):
 
         # Build command frame for multiple memory area read
         command_code = self.command_codes.MULTIPLE_MEMORY_AREA_READ
-        sid = service_id.to_bytes(1, 'big')
+        sid = self.next_service_id() if service_id is None else service_id.to_bytes(1, 'big')
 
         # Build data part following test_code.py logic
         addresses = list(dict_memory_codes.keys())
-        data_part = bytearray()
+        record_size = MULTIPLE_READ_RECORD_STRUCT.size
+        data_part = bytearray(len(addresses) * record_size)
 
         if self.debug:
             self.logger.debug(f"Building MULTIPLE_MEMORY_AREA_READ command (0x0104) for {len(addresses)} addresses")
 
-        for address in addresses:
+        for i, address in enumerate(addresses):
             # Validate address
             validate_address(address)
 
@@ -748,12 +913,12 @@ class FinsUdpConnection(FinsConnection):
             # Byte 1: Memory area code
             # Bytes 2-3: Address (2 bytes)
             # Byte 4: Bit position (0x00 for word access)
-            area_data = bytearray(4)
-            area_data[0] = addr_info['memory_type_code']      # Area code (1 byte)
-            area_data[1:3] = bytes(addr_info['offset_bytes']) # Address (2 bytes)
-            area_data[3] = 0x00                               # Bit position (1 byte)
-            
-            data_part += area_data
+            MULTIPLE_READ_RECORD_STRUCT.pack_into(
+                data_part, i * record_size,
+                addr_info['memory_type_code'],  # Area code (1 byte)
+                addr_info['word_address'],      # Address (2 bytes)
+                0x00                            # Bit position (1 byte)
+            )
 
         # Build FINS command frame (no number of items prefix needed - test_code.py format)
         command_frame = self.fins_command_frame(command_code=command_code, service_id=sid, text=data_part)
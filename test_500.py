@@ -7,22 +7,34 @@ for PLC registers D0001 to D500.
 """
 
 import asyncio
+import functools
+import itertools
+import logging
 import sys
 from datetime import datetime
 import time
 import csv
+import struct
+
+try:
+    import numpy as np  # Optional - vectorized decode of multiple read responses
+except ImportError:
+    np = None
+
+try:
+    import uvloop  # Optional - faster event loop for the UDP round-trips
+except ImportError:
+    uvloop = None
 
 # Import the FINS protocol components
 from OMRON_FINS_PROTOCOL.Infrastructure.udp_connection import FinsUdpConnection
 from OMRON_FINS_PROTOCOL.Fins_domain.mem_address_parser import FinsAddressParser
-from OMRON_FINS_PROTOCOL.components.conversion import (
-    toInt16, toUInt16, WordToHex
-)
-from OMRON_FINS_PROTOCOL.Fins_domain.frames import FinsResponseFrame
 from OMRON_FINS_PROTOCOL.exception.exception_rules import (
     FinsConnectionError, FinsTimeoutError, FinsAddressError
 )
 
+log = logging.getLogger(__name__)
+
 # =============================================================================
 # CONFIGURATION - MODIFY THIS SECTION
 # =============================================================================
@@ -32,6 +44,59 @@ PLC_IP = "192.168.2.2"
 
 # Batch configuration
 BATCH_SIZE = 20  # Number of addresses per batch for multiple read
+ADAPTIVE_BATCHING = False  # Grow/shrink the batch size from measured batch times
+MAX_BATCH_SIZE = 128  # Upper bound for adaptive batch size
+TARGET_BATCH_TIME = 0.02  # Keep doubling the batch size while a batch completes faster than this (seconds)
+
+# Phase configuration
+CONCURRENT_PHASES = False  # Run the single and batch read phases together (faster verification,
+                           # but each phase's timings then include the other phase's traffic)
+
+# Range grouping configuration
+GROUP_CONTIGUOUS_RANGES = False  # Read runs of consecutive words with one MEMORY_AREA_READ (0x0101)
+                                 # instead of MULTIPLE_MEMORY_AREA_READ (0x0104) - off by default so the
+                                 # batch phase measures the multiple read it is compared as
+MAX_RANGE_WORDS = 999  # Maximum words per MEMORY_AREA_READ command
+
+# Concurrency configuration
+MAX_IN_FLIGHT = 32  # Maximum concurrent read requests (single reads or batches)
+
+# 4-byte record per address for MULTIPLE_MEMORY_AREA_READ (0x0104):
+# Memory area code (1 byte) + Address (2 bytes) + Bit position (1 byte)
+MULTI_READ_RECORD = struct.Struct('>BHB')
+
+# Reusable command data buffer for multiple reads - the frame built from it is a
+# copy and there is no await between filling it and building the frame, so
+# concurrent batches can share it
+MULTI_READ_BUFFER = bytearray()
+
+# 8-byte MEMORY_AREA_READ (0x0101) command data:
+# Command code (2 bytes) + Memory area code (1 byte) + Address (2 bytes)
+# + Bit position (1 byte) + Read size (2 bytes)
+SINGLE_READ_COMMAND = struct.Struct('>2sBHBH')
+
+# Big-endian 16-bit word decoders
+INT16 = struct.Struct('>h')
+UINT16 = struct.Struct('>H')
+
+# Failures that mark a single read or batch as failed - timeouts, socket errors
+# and short responses. Anything else is a bug and propagates to the caller.
+READ_ERRORS = (FinsTimeoutError, FinsConnectionError, OSError, struct.error)
+
+# Fixed FINS response layout offsets
+RESPONSE_END_CODE_OFFSET = 12
+RESPONSE_DATA_OFFSET = 14
+
+# Shared address parser - parsing only reads the parser's lookup tables
+ADDRESS_PARSER = FinsAddressParser()
+
+@functools.lru_cache(maxsize=8192)
+def _parse_addr(address):
+    """Parse an address once and return (memory_type_code, word_address, bit_number).
+    Cached because the same D-series addresses are read on every run; a tuple is
+    returned so callers cannot mutate the cached result."""
+    addr_info = ADDRESS_PARSER.parse(address)
+    return addr_info['memory_type_code'], addr_info['word_address'], addr_info['bit_number'] or 0
 
 # Generate addresses from D0001 to D500
 def generate_test_addresses():
@@ -51,81 +116,164 @@ print(f"📊 Generated {len(TEST_ADDRESSES)} test addresses from D0001 to D500")
 # TEST FUNCTIONS
 # =============================================================================
 
+def _parse_read_response(response, data_type):
+    """Decode a single-word MEMORY_AREA_READ response at fixed offsets, the same
+    way the batch read decodes it: UINT16 unsigned, every other type as INT16.
+    Returns None if the PLC reported an error."""
+    response_view = memoryview(response)
+    if response_view[RESPONSE_END_CODE_OFFSET:RESPONSE_DATA_OFFSET] != b'\x00\x00':
+        return None
+    word = UINT16 if data_type == "UINT16" else INT16
+    return word.unpack_from(response_view, RESPONSE_DATA_OFFSET)[0]
+
 async def single_read_address(fins, address, data_type):
-    """Read a single address and return success status and timing"""
+    """Read a single address and return success status, read time (integer nanoseconds) and value"""
     try:
-        address_parser = FinsAddressParser()
         command_codes = fins.command_codes
         
-        # Parse address to FINS format
-        addr_info = address_parser.parse(address)
+        # Parse address to FINS format (cached)
+        memory_type_code, word_address, bit_number = _parse_addr(address)
         
-        # Determine read size based on data type
-        read_size = 1  # Single word for INT16
+        # One word per address, as in the batch read the values are compared against
+        read_size = 1
         
-        # Build command data
-        command_data = bytearray(8)
-        command_data[0:2] = command_codes.MEMORY_AREA_READ
-        command_data[2] = addr_info['memory_type_code']
-        command_data[3:5] = bytes(addr_info['offset_bytes'])
-        command_data[5] = addr_info['bit_number'] if addr_info['bit_number'] else 0
-        command_data[6:8] = read_size.to_bytes(2, 'big')
+        # Build command data in a single pack
+        command_data = SINGLE_READ_COMMAND.pack(
+            command_codes.MEMORY_AREA_READ, memory_type_code, word_address, bit_number, read_size
+        )
         
         # Build complete frame
         command_frame = fins.fins_command_frame(
             command_code=command_data,
-            service_id=b'\x00'
+            service_id=fins.next_service_id()  # Distinct SID per in-flight request
         )
         
-        # Execute with timing
-        start_time = time.perf_counter()
-        response = await fins.execute_fins_command_frame(command_frame)
-        end_time = time.perf_counter()
+        # Execute with timing - single attempt without the retry/logging wrapper,
+        # a failed read is reported to the caller
+        # Integer nanosecond clock - no float conversion per read; summed once by the caller
+        start_time = time.perf_counter_ns()
+        response = await fins._raw_request(command_frame)
+        end_time = time.perf_counter_ns()
+        
+        read_time = end_time - start_time
         
-        # Parse response
-        response_frame = FinsResponseFrame()
-        response_frame.from_bytes(response)
+        value = _parse_read_response(response, data_type)
         
-        if response_frame.end_code == b'\x00\x00':
-            raw_data = response_frame.text
-            value = toInt16(raw_data)[0]
-            return True, end_time - start_time, value
+        return value is not None, read_time, value
+            
+    except READ_ERRORS as e:
+        log.debug("Single read of %s failed: %s", address, e)
+        return False, 0, None
+
+def group_contiguous_runs(addresses_dict):
+    """Split addresses into runs of consecutive word addresses in the same memory area.
+    Returns a list of (memory_type_code, start_word, [(address, data_type), ...]) runs,
+    each at most MAX_RANGE_WORDS long."""
+    entries = sorted(
+        (_parse_addr(address)[:2], address, data_type)
+        for address, data_type in addresses_dict.items()
+    )
+    
+    runs = []
+    previous = None
+    for (memory_type_code, word_address), address, data_type in entries:
+        if (previous is not None and previous == (memory_type_code, word_address - 1)
+                and len(runs[-1][2]) < MAX_RANGE_WORDS):
+            runs[-1][2].append((address, data_type))
         else:
+            runs.append((memory_type_code, word_address, [(address, data_type)]))
+        previous = (memory_type_code, word_address)
+    return runs
+
+async def range_read_address(fins, memory_type_code, start_word, run):
+    """Read a run of consecutive words with one MEMORY_AREA_READ (0x0101) command.
+    Returns the values keyed by address, or None if the PLC reports an error."""
+    command_data = SINGLE_READ_COMMAND.pack(
+        fins.command_codes.MEMORY_AREA_READ, memory_type_code, start_word, 0x00, len(run)
+    )
+    command_frame = fins.fins_command_frame(command_code=command_data, service_id=fins.next_service_id())
+    response = await fins.execute_fins_command_frame(command_frame)
+    
+    # Response data is 2 bytes per word with no per-item status byte
+    response_view = memoryview(response)
+    if response_view[RESPONSE_END_CODE_OFFSET:RESPONSE_DATA_OFFSET] != b'\x00\x00':
+        return None
+    raw_data = response_view[RESPONSE_DATA_OFFSET:]
+    return {
+        address: (UINT16 if data_type == "UINT16" else INT16).unpack_from(raw_data, i * 2)[0]
+        for i, (address, data_type) in enumerate(run)
+    }
+
+async def multiple_read_address(fins, addresses_dict, group_ranges=GROUP_CONTIGUOUS_RANGES):
+    """Read multiple addresses and return timing info.
+    With group_ranges set, runs of consecutive words are read with one MEMORY_AREA_READ
+    each and the remaining addresses with one MULTIPLE_MEMORY_AREA_READ, all concurrently."""
+    if not group_ranges:
+        return await multiple_item_read_address(fins, addresses_dict)
+    
+    try:
+        runs = group_contiguous_runs(addresses_dict)
+        ranges = [run for run in runs if len(run[2]) > 1]
+        if not ranges:
+            return await multiple_item_read_address(fins, addresses_dict)
+        singles = dict(run[2][0] for run in runs if len(run[2]) == 1)
+        
+        start_time = time.perf_counter()
+        reads = [range_read_address(fins, *run) for run in ranges]
+        if singles:
+            reads.append(multiple_item_read_address(fins, singles))
+        outcomes = await asyncio.gather(*reads)
+        end_time = time.perf_counter()
+        
+        if singles:
+            success, _, single_values = outcomes.pop()
+            if not success:
+                return False, end_time - start_time, None
+        if any(range_values is None for range_values in outcomes):
             return False, end_time - start_time, None
-            
-    except Exception as e:
+        
+        read_values = {}
+        for range_values in outcomes:
+            read_values.update(range_values)
+        if singles:
+            read_values.update(single_values)
+        # Keep the caller's address order
+        values = {address: read_values[address] for address in addresses_dict}
+        return True, end_time - start_time, values
+    
+    except READ_ERRORS as e:
+        log.debug("Range read failed: %s", e)
         return False, 0, None
 
-async def multiple_read_address(fins, addresses_dict):
-    """Read multiple addresses in a single command and return timing info"""
+async def multiple_item_read_address(fins, addresses_dict):
+    """Read multiple addresses in a single MULTIPLE_MEMORY_AREA_READ command and return timing info"""
     try:
-        address_parser = FinsAddressParser()
         command_codes = fins.command_codes
         
-        # Build command data for multiple read
-        addresses = list(addresses_dict.keys())
+        # Build command data for multiple read - the items are taken once as a
+        # tuple and reused for both the request and the response decode
+        items = tuple(addresses_dict.items())
         
-        data_part = bytearray()
+        # Size the shared command buffer to exactly one 4-byte record per address
+        data_part = MULTI_READ_BUFFER
+        record_size = MULTI_READ_RECORD.size
+        data_size = len(items) * record_size
+        if len(data_part) < data_size:
+            data_part.extend(bytes(data_size - len(data_part)))
+        else:
+            del data_part[data_size:]
         
-        for address in addresses:
-            addr_info = address_parser.parse(address)
-            
-            # Build 4-byte structure for each address:
-            # Byte 1: Memory area code
-            # Bytes 2-3: Address (2 bytes)
-            # Byte 4: Bit position (0x00 for word access)
-            area_data = bytearray(4)
-            area_data[0] = addr_info['memory_type_code']      # Area code (1 byte)
-            area_data[1:3] = bytes(addr_info['offset_bytes']) # Address (2 bytes)
-            area_data[3] = 0x00                               # Bit position (1 byte)
-            
-            data_part += area_data
+        # Pack 4-byte structure for each address in place (0x00 bit position for word access)
+        pack_into = MULTI_READ_RECORD.pack_into
+        for i, (address, _) in enumerate(items):
+            memory_type_code, word_address, _ = _parse_addr(address)
+            pack_into(data_part, i * record_size, memory_type_code, word_address, 0x00)
         
         # Build FINS command frame with 0x0104 command code
         command_frame = fins.fins_command_frame(
             command_code=command_codes.MULTIPLE_MEMORY_AREA_READ,  # 0x0104
             text=data_part,
-            service_id=b'\x00'
+            service_id=fins.next_service_id()
         )
         
         # Execute with timing
@@ -133,114 +281,177 @@ async def multiple_read_address(fins, addresses_dict):
         response = await fins.execute_fins_command_frame(command_frame)
         end_time = time.perf_counter()
         
-        response_frame = FinsResponseFrame()
-        response_frame.from_bytes(response)
-        
-        if response_frame.end_code == b'\x00\x00':
-            raw_data = response_frame.text
+        # Decode inline from the fixed response layout (no frame object):
+        # header (10) + command code (2) + end code (2) + data
+        # Slices of the memoryview share the response buffer - no per-slice copies
+        response_view = memoryview(response)
+        if response_view[RESPONSE_END_CODE_OFFSET:RESPONSE_DATA_OFFSET] == b'\x00\x00':
+            raw_data = response_view[RESPONSE_DATA_OFFSET:]
+            
+            # A short response is a failed read on both decode paths
+            count = len(items)
+            if len(raw_data) < count * 3:
+                log.debug("Multiple read response too short: %d bytes for %d addresses", len(raw_data), count)
+                return False, end_time - start_time, None
+            
+            if np is not None:
+                # Decode every word in one call: view the data as (N, 3) records of
+                # 1 status byte + 2 data bytes and reinterpret the data bytes as big-endian words
+                words = np.frombuffer(raw_data, dtype=np.uint8, count=count * 3).reshape(count, 3)[:, 1:3].copy()
+                int16_values = words.view('>i2').ravel().tolist()
+                uint16_values = words.view('>u2').ravel().tolist()
+                values = {
+                    address: (uint16_values[i] if data_type == "UINT16" else int16_values[i])
+                    for i, (address, data_type) in enumerate(items)
+                }
+                return True, end_time - start_time, values
+            
             values = {}
             
             # Parse each address: 1 status byte + 2 data bytes (3 bytes total per address)
-            for i, (address, data_type) in enumerate(addresses_dict.items()):
+            for i, (address, data_type) in enumerate(items):
                 start_idx = i * 3  # Each address takes 3 bytes: 1 status + 2 data
                 
-                # Extract status byte and data bytes
-                status_byte = raw_data[start_idx:start_idx + 1]
-                value_bytes = raw_data[start_idx + 1:start_idx + 3]  # Skip status byte, get 2 data bytes
-                
-                if data_type == "INT16":
-                    value = toInt16(value_bytes)[0]
-                elif data_type == "UINT16":
-                    value = toUInt16(value_bytes)[0]
-                else:
-                    value = toInt16(value_bytes)[0]  # Default to INT16
-                
-                values[address] = value
+                # Skip status byte and unpack the 2 data bytes in place (default to INT16)
+                unpack_from = UINT16.unpack_from if data_type == "UINT16" else INT16.unpack_from
+                values[address] = unpack_from(raw_data, start_idx + 1)[0]
             
             return True, end_time - start_time, values
         else:
             return False, end_time - start_time, None
             
-    except Exception as e:
+    except READ_ERRORS as e:
+        log.debug("Multiple read failed: %s", e)
         return False, 0, None
 
-async def batch_read_addresses(fins, addresses_dict, batch_size=20):
-    """Read addresses in batches using multiple read commands"""
-    try:
-        total_start_time = time.perf_counter()
-        all_values = {}
-        total_command_time = 0
-        successful_batches = 0
-        failed_batches = 0
-        
-        # Convert addresses_dict to list for batching
-        addresses_list = list(addresses_dict.items())
-        total_batches = (len(addresses_list) + batch_size - 1) // batch_size  # Ceiling division
-        
-        print(f"📦 Processing {len(addresses_list)} addresses in {total_batches} batches of {batch_size}")
-        
-        # Process addresses in batches
-        for batch_num in range(total_batches):
-            start_idx = batch_num * batch_size
-            end_idx = min(start_idx + batch_size, len(addresses_list))
-            batch_addresses = dict(addresses_list[start_idx:end_idx])
-            
-            print(f"   📊 Processing batch {batch_num + 1}/{total_batches} ({len(batch_addresses)} addresses)")
-            
-            # Perform multiple read for this batch
-            success, command_time, batch_values = await multiple_read_address(fins, batch_addresses)
-            
-            if success and batch_values:
-                successful_batches += 1
-                total_command_time += command_time
-                all_values.update(batch_values)
-                print(f"      ✅ Batch {batch_num + 1} successful ({len(batch_values)} values)")
-            else:
-                failed_batches += 1
-                print(f"      ❌ Batch {batch_num + 1} failed")
-        
-        total_end_time = time.perf_counter()
-        total_execution_time = total_end_time - total_start_time
-        
-        return {
-            'success': successful_batches > 0,
-            'total_addresses': len(addresses_list),
-            'addresses_read': len(all_values),
-            'successful_batches': successful_batches,
-            'failed_batches': failed_batches,
-            'total_batches': total_batches,
-            'batch_size': batch_size,
-            'total_execution_time': total_execution_time,
-            'total_command_time': total_command_time,
-            'avg_batch_time': total_command_time / successful_batches if successful_batches > 0 else 0,
-            'addresses_per_second': len(all_values) / total_execution_time if total_execution_time > 0 else 0,
-            'values': all_values
-        }
+async def adaptive_batch_read(fins, addresses_dict, batch_size, max_batch_size, target_batch_time):
+    """Read addresses in sequential batches, doubling the batch size while batches
+    succeed faster than target_batch_time and halving it after a failed batch.
+    Returns the batches, their read results and the final batch size."""
+    batches = []
+    results = []
+    items = iter(addresses_dict.items())
+    
+    while True:
+        batch_addresses = dict(itertools.islice(items, batch_size))
+        if not batch_addresses:
+            break
+        
+        success, command_time, batch_values = await multiple_read_address(fins, batch_addresses)
+        batches.append(batch_addresses)
+        results.append((success, command_time, batch_values))
+        
+        if not success:
+            batch_size = max(batch_size // 2, 1)
+        elif command_time < target_batch_time:
+            batch_size = min(batch_size * 2, max_batch_size)
+    
+    return batches, results, batch_size
+
+async def batch_read_addresses(fins, addresses_dict, batch_size=20, verbose=False, adaptive=False,
+                               max_batch_size=MAX_BATCH_SIZE, target_batch_time=TARGET_BATCH_TIME):
+    """Read addresses in batches using multiple read commands.
+    With adaptive set, batch_size is only the starting size (see adaptive_batch_read).
+    Per-batch status is only printed (as one summary) when verbose is set."""
+    total_start_time = time.perf_counter()
+    all_values = {}
+    total_command_time = 0
+    successful_batches = 0
+    failed_batches = 0
+    final_batch_size = batch_size
+    
+    total_addresses = len(addresses_dict)
+    
+    if adaptive:
+        print(f"📦 Processing {total_addresses} addresses in adaptive batches starting at {batch_size} (max {max_batch_size})")
+        batches, results, final_batch_size = await adaptive_batch_read(
+            fins, addresses_dict, batch_size, max_batch_size, target_batch_time
+        )
+        total_batches = len(batches)
+    else:
+        total_batches = (total_addresses + batch_size - 1) // batch_size  # Ceiling division
         
-    except Exception as e:
-        print(f"❌ Batch read exception: {e}")
-        return {
-            'success': False,
-            'total_addresses': len(addresses_dict),
-            'addresses_read': 0,
-            'successful_batches': 0,
-            'failed_batches': 0,
-            'total_batches': 0,
-            'batch_size': batch_size,
-            'total_execution_time': 0,
-            'total_command_time': 0,
-            'avg_batch_time': 0,
-            'addresses_per_second': 0,
-            'values': {}
-        }
+        print(f"📦 Processing {total_addresses} addresses in {total_batches} batches of {batch_size}")
+        
+        # Split addresses into batches and dispatch all of them concurrently
+        # (at most MAX_IN_FLIGHT outstanding); each batch is an independent
+        # multiple read round-trip.
+        # Batches are sliced lazily off the items iterator - no full list copy
+        items = iter(addresses_dict.items())
+        batches = [dict(itertools.islice(items, batch_size)) for _ in range(total_batches)]
+        semaphore = asyncio.Semaphore(MAX_IN_FLIGHT)
+        
+        async def bounded_read(batch_addresses):
+            async with semaphore:
+                return await multiple_read_address(fins, batch_addresses)
+        
+        outcomes = await asyncio.gather(
+            *(bounded_read(batch_addresses) for batch_addresses in batches),
+            return_exceptions=True
+        )
+        # Every batch runs to completion before an unexpected error is re-raised;
+        # read failures are already reported by the batch as (False, 0, None)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        results = outcomes
+    
+    # Per-batch status lines are only built when they will be shown
+    report_batches = verbose or log.isEnabledFor(logging.DEBUG)
+    batch_status = []
+    for batch_num, (batch_addresses, (success, command_time, batch_values)) in enumerate(zip(batches, results), 1):
+        if success and batch_values:
+            successful_batches += 1
+            total_command_time += command_time
+            all_values.update(batch_values)
+            if report_batches:
+                batch_status.append(f"   ✅ Batch {batch_num}/{total_batches} successful ({len(batch_values)} values)")
+        else:
+            failed_batches += 1
+            if report_batches:
+                batch_status.append(f"   ❌ Batch {batch_num}/{total_batches} failed ({len(batch_addresses)} addresses)")
+    
+    if verbose:
+        print("\n".join(batch_status))
+    elif report_batches:
+        log.debug("Batch status:\n%s", "\n".join(batch_status))
+    
+    total_end_time = time.perf_counter()
+    total_execution_time = total_end_time - total_start_time
+    
+    return {
+        'success': successful_batches > 0,
+        'total_addresses': total_addresses,
+        'addresses_read': len(all_values),
+        'successful_batches': successful_batches,
+        'failed_batches': failed_batches,
+        'total_batches': total_batches,
+        'batch_size': batch_size,
+        'final_batch_size': final_batch_size,
+        'total_execution_time': total_execution_time,
+        'total_command_time': total_command_time,
+        'avg_batch_time': total_command_time / successful_batches if successful_batches > 0 else 0,
+        'addresses_per_second': len(all_values) / total_execution_time if total_execution_time > 0 else 0,
+        'values': all_values
+    }
+
+def print_sample_values(values, count=10):
+    """Print the first and last count values - only those items are touched,
+    the full key list is never materialized"""
+    print(f"📋 Sample values (first {count}):")
+    for addr, value in itertools.islice(values.items(), count):
+        print(f"   📊 {addr}: {value}")
+    print(f"📋 Sample values (last {count}):")
+    for addr, value in reversed(list(itertools.islice(reversed(values.items()), count))):
+        print(f"   📊 {addr}: {value}")
 
-async def test_batch_read_timing(fins, addresses_dict, batch_size=20):
+async def test_batch_read_timing(fins, addresses_dict, batch_size=20, adaptive=False):
     """Test reading addresses in batches and measure timing"""
-    print(f"📦 Testing Batch Read Performance (Batch Size: {batch_size})")
+    print(f"📦 Testing Batch Read Performance (Batch Size: {batch_size}{', adaptive' if adaptive else ''})")
     print("=" * 60)
     print(f"📊 Reading {len(addresses_dict)} addresses in batches of {batch_size}...")
     
-    batch_results = await batch_read_addresses(fins, addresses_dict, batch_size)
+    batch_results = await batch_read_addresses(fins, addresses_dict, batch_size, adaptive=adaptive)
     
     print("📊 BATCH READ RESULTS:")
     print("=" * 60)
@@ -250,6 +461,8 @@ async def test_batch_read_timing(fins, addresses_dict, batch_size=20):
         print(f"📦 Successful batches: {batch_results['successful_batches']}/{batch_results['total_batches']}")
         print(f"❌ Failed batches: {batch_results['failed_batches']}")
         print(f"📏 Batch size: {batch_results['batch_size']} addresses per batch")
+        if adaptive:
+            print(f"📏 Final adaptive batch size: {batch_results['final_batch_size']} addresses per batch")
         print(f"⏱️  Total execution time: {batch_results['total_execution_time']:.4f} seconds")
         print(f"⏱️  Total command time: {batch_results['total_command_time']:.4f} seconds")
         print(f"⏱️  Average batch time: {batch_results['avg_batch_time']:.6f} seconds")
@@ -257,13 +470,7 @@ async def test_batch_read_timing(fins, addresses_dict, batch_size=20):
         
         # Show sample values
         if batch_results['values']:
-            addr_list = list(batch_results['values'].keys())
-            print(f"📋 Sample values (first 10):")
-            for addr in addr_list[:10]:
-                print(f"   📊 {addr}: {batch_results['values'][addr]}")
-            print(f"📋 Sample values (last 10):")
-            for addr in addr_list[-10:]:
-                print(f"   📊 {addr}: {batch_results['values'][addr]}")
+            print_sample_values(batch_results['values'])
     else:
         print("❌ Batch read failed")
     
@@ -277,34 +484,46 @@ async def test_single_reads_timing(fins, addresses_dict):
     print(f"📊 Reading {len(addresses_dict)} addresses individually...")
     
     total_start_time = time.perf_counter()
-    successful_reads = 0
-    failed_reads = 0
-    total_read_time = 0
-    min_time = float('inf')
-    max_time = 0
-    single_values = {}  # Store values for CSV comparison
     
-    # Read each address individually
-    for i, (address, data_type) in enumerate(addresses_dict.items(), 1):
-        success, read_time, value = await single_read_address(fins, address, data_type)
-        
+    # Read all addresses concurrently, with at most MAX_IN_FLIGHT requests outstanding
+    semaphore = asyncio.Semaphore(MAX_IN_FLIGHT)
+    
+    async def bounded_read(address, data_type):
+        async with semaphore:
+            return address, await single_read_address(fins, address, data_type)
+    
+    # Store values for CSV comparison in address order (None marks failed reads)
+    single_values = dict.fromkeys(addresses_dict)
+    read_times = []
+    
+    # Handle each response as soon as it completes, overlapping with the reads still in flight
+    tasks = [asyncio.create_task(bounded_read(address, data_type)) for address, data_type in addresses_dict.items()]
+    unexpected_error = None
+    for completed in asyncio.as_completed(tasks):
+        try:
+            address, (success, read_time, value) = await completed
+        except Exception as e:
+            # Like the batch phase, every read runs to completion before an unexpected
+            # error is re-raised; read failures are already reported as (False, 0, None)
+            unexpected_error = unexpected_error or e
+            continue
         if success:
-            successful_reads += 1
-            total_read_time += read_time
-            min_time = min(min_time, read_time)
-            max_time = max(max_time, read_time)
-            single_values[address] = value  # Store value for CSV
-            
-            # Print progress every 50 reads
-            if i % 50 == 0:
-                print(f"   📈 Progress: {i}/{len(addresses_dict)} reads completed")
-        else:
-            failed_reads += 1
-            single_values[address] = None  # Mark failed reads
+            single_values[address] = value
+            read_times.append(read_time)
+    if unexpected_error is not None:
+        raise unexpected_error
     
     total_end_time = time.perf_counter()
     total_execution_time = total_end_time - total_start_time
     
+    # Per-read times are integer nanoseconds - convert to seconds once for the summary
+    successful_reads = len(read_times)
+    failed_reads = len(tasks) - successful_reads
+    total_read_time = sum(read_times) / 1e9
+    min_time = min(read_times, default=0) / 1e9
+    max_time = max(read_times, default=0) / 1e9
+    log.info("Single reads completed %d/%d", successful_reads, len(tasks))
+    
     # Calculate statistics
     avg_read_time = total_read_time / successful_reads if successful_reads > 0 else 0
     
@@ -326,7 +545,7 @@ async def test_single_reads_timing(fins, addresses_dict):
         'total_execution_time': total_execution_time,
         'total_read_time': total_read_time,
         'avg_read_time': avg_read_time,
-        'min_read_time': min_time if min_time != float('inf') else 0,
+        'min_read_time': min_time,
         'max_read_time': max_time,
         'reads_per_second': successful_reads / total_execution_time if total_execution_time > 0 else 0,
         'values': single_values  # Include values for CSV export
@@ -357,13 +576,7 @@ async def test_multiple_read_timing(fins, addresses_dict):
         print(f"⚡ Speed advantage: {len(values) / read_time:.0f}x faster per address")
         
         # Show first 10 and last 10 values as sample
-        addr_list = list(values.keys())
-        print(f"📋 Sample values (first 10):")
-        for addr in addr_list[:10]:
-            print(f"   📊 {addr}: {values[addr]}")
-        print(f"📋 Sample values (last 10):")
-        for addr in addr_list[-10:]:
-            print(f"   📊 {addr}: {values[addr]}")
+        print_sample_values(values)
             
         result = {
             'success': True,
@@ -433,38 +646,41 @@ def compare_performance(single_results, multiple_results, batch_results=None):
         print("❌ Unable to perform comparison - single read test failed")
     
     print()
-def create_data_verification_csv(single_results, batch_results, default_filename="data_500.csv"):
-    """Create a CSV file to compare values from both reading methods"""
+def create_data_verification_csv(single_results, batch_results, default_filename="data_500.csv", addresses_dict=None):
+    """Create a CSV file to compare values from both reading methods.
+    Rows follow the order of addresses_dict when given, otherwise the sorted addresses read."""
     print("📝 Creating data verification CSV file...")
     print("=" * 60)
     current_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"{current_timestamp}_{default_filename}"
     try:
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
             writer = csv.writer(csvfile)
             
-            # Write header
-            writer.writerow(['plc_reg', 'method_1', 'method_2'])
+            single_values = single_results.get('values', {})
+            batch_values = batch_results.get('values', {})
             
-            # Get all addresses (should be the same for both methods)
-            all_addresses = set()
-            if 'values' in single_results:
-                all_addresses.update(single_results['values'].keys())
-            if batch_results.get('values'):
-                all_addresses.update(batch_results['values'].keys())
-            
-            # Sort addresses for consistent ordering
-            sorted_addresses = sorted(all_addresses, key=lambda x: int(x[1:]))  # Sort by numeric part
+            if addresses_dict is not None:
+                # Both methods read the same addresses - keep their insertion order, no set or sort
+                sorted_addresses = addresses_dict.keys()
+            else:
+                # Sort addresses by (memory area, word) - decorate with the cached parse,
+                # sort the tuples and undecorate, so no key function runs per compare
+                decorated = [(_parse_addr(address)[:2], address) for address in single_values.keys() | batch_values.keys()]
+                decorated.sort()
+                sorted_addresses = [address for _, address in decorated]
             
-            # Write data rows
+            # Single pass: build data rows, count failures and matches together;
+            # the header and all rows go out in one writerows call
+            rows = [('plc_reg', 'method_1', 'method_2')]
             matches = 0
             mismatches = 0
             single_missing = 0
             batch_missing = 0
             
             for address in sorted_addresses:
-                single_value = single_results.get('values', {}).get(address, 'N/A')
-                batch_value = batch_results.get('values', {}).get(address, 'N/A')
+                single_value = single_values.get(address, 'N/A')
+                batch_value = batch_values.get(address, 'N/A')
                 
                 # Convert None values to 'FAILED' for better readability
                 if single_value is None:
@@ -481,7 +697,9 @@ def create_data_verification_csv(single_results, batch_results, default_filename
                     else:
                         mismatches += 1
                 
-                writer.writerow([address, single_value, batch_value])
+                rows.append((address, single_value, batch_value))
+            
+            writer.writerows(rows)
         
         print(f"✅ CSV file '{filename}' created successfully!")
         print(f"📊 Data verification summary:")
@@ -525,15 +743,24 @@ async def main():
         print("✅ Connection initialized successfully")
         print()
         
-        # Test 1: Single reads timing
-        print("🔍 PHASE 1: Single Read Performance Test")
-        print("=" * 60)
-        single_results = await test_single_reads_timing(fins, TEST_ADDRESSES)
-        
-        # Test 2: Batch read timing
-        print("📦 PHASE 2: Batch Read Performance Test")
-        print("=" * 60)
-        batch_results = await test_batch_read_timing(fins, TEST_ADDRESSES, BATCH_SIZE)
+        if CONCURRENT_PHASES:
+            # Tests 1 and 2 together - responses are matched by service ID on the shared socket
+            print("🔍📦 PHASES 1+2: Single and Batch Read Tests (concurrent)")
+            print("=" * 60)
+            single_results, batch_results = await asyncio.gather(
+                test_single_reads_timing(fins, TEST_ADDRESSES),
+                test_batch_read_timing(fins, TEST_ADDRESSES, BATCH_SIZE, ADAPTIVE_BATCHING)
+            )
+        else:
+            # Test 1: Single reads timing
+            print("🔍 PHASE 1: Single Read Performance Test")
+            print("=" * 60)
+            single_results = await test_single_reads_timing(fins, TEST_ADDRESSES)
+            
+            # Test 2: Batch read timing
+            print("📦 PHASE 2: Batch Read Performance Test")
+            print("=" * 60)
+            batch_results = await test_batch_read_timing(fins, TEST_ADDRESSES, BATCH_SIZE, ADAPTIVE_BATCHING)
         
         # Compare performance
         compare_performance(single_results, None, batch_results)
@@ -551,7 +778,7 @@ async def main():
         # Create CSV file for data verification
         print("📝 DATA VERIFICATION")
         print("=" * 60)
-        csv_success = create_data_verification_csv(single_results, batch_results, "data_500.csv")
+        csv_success = create_data_verification_csv(single_results, batch_results, "data_500.csv", TEST_ADDRESSES)
         
         if csv_success:
             print("✅ Data verification CSV created successfully")
@@ -584,6 +811,9 @@ if __name__ == "__main__":
     print("Press Ctrl+C to interrupt")
     print()
     
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -22,10 +22,7 @@ def _extract_bit_value_from_hex(hex_string: str, bit_number: int) -> int:
         word_value = int(hex_string[:4], 16)  # Take first 4 hex chars (16 bits)
         
         # Extract specific bit (bit 0 = LSB, bit 15 = MSB)
-        bit_value = (word_value >> bit_number) & 1
-        
-        print(f"Boolean extraction: HEX:{hex_string} -> Word:{word_value:016b} -> Bit {bit_number}: {bit_value}")
-        return bit_value
+        return (word_value >> bit_number) & 1
         
     except (ValueError, IndexError) as e:
         print(f"Error extracting bit {bit_number} from HEX '{hex_string}': {e}")
@@ -41,12 +38,12 @@ def _get_bit_number_from_address(plc_address: str) -> int:
     Returns:
         Bit number (0-15), or 0 if not a bit address
     """
-    try:
-        if '.' in plc_address:
-            bit_part = plc_address.split('.')[1]
-            return int(bit_part)
+    _, dot, bit_part = plc_address.partition('.')
+    if not dot:
         return 0
-    except (ValueError, IndexError):
+    try:
+        return int(bit_part.partition('.')[0])
+    except ValueError:
         return 0
 
 def test_boolean_conversion():
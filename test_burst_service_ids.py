@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for the service ID (SID) bookkeeping of FinsUdpConnection: a burst of FINS
+frames never takes over a SID still in flight, and a request waiting on a busy SID
+survives a socket error that fails the request holding it.
+
+A local UDP responder echoes each command's data back after a delay taken from
+the first data byte (in 1/100 s), so the test controls which request is in
+flight when the burst registers its service IDs.
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+from OMRON_FINS_PROTOCOL.Infrastructure.udp_connection import FinsUdpConnection
+
+
+class DelayedEchoResponder(asyncio.DatagramProtocol):
+    """Answers every FINS command with its own data, after text[0] / 100 seconds."""
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        # Response: header (SID echoed) + command code + end code 0000 + command data
+        response = data[:12] + b'\x00\x00' + data[12:]
+        asyncio.get_running_loop().call_later(data[12] / 100, self.transport.sendto, response, addr)
+
+
+async def _burst_during_in_flight_requests():
+    loop = asyncio.get_running_loop()
+    responder, _ = await loop.create_datagram_endpoint(DelayedEchoResponder, local_addr=("127.0.0.1", 0))
+    port = responder.get_extra_info('sockname')[1]
+
+    fins = FinsUdpConnection("127.0.0.1", port=port, timeout=2)
+    await fins.connect()
+    try:
+        def frame(service_id, text):
+            return fins.fins_command_frame(command_code=b'\x01\x01', text=text, service_id=bytes([service_id]))
+
+        # B holds SID 2 until t=0.30
+        task_b = asyncio.create_task(fins.execute_fins_command_frame(frame(2, b'\x1eB')))
+        await asyncio.sleep(0.01)
+        # The burst needs SIDs 1 and 2, so it waits for B
+        burst = asyncio.create_task(fins.execute_fins_command_frames([frame(1, b'\x14X'), frame(2, b'\x14Y')]))
+        await asyncio.sleep(0.04)
+        # C claims SID 1 while the burst is waiting; its reply (t=0.35) comes after B's
+        # but before the burst's, so a burst that took SID 1 at t=0.30 would get C's data
+        task_c = asyncio.create_task(fins.execute_fins_command_frame(frame(1, b'\x1eC')))
+
+        response_b, burst_responses, response_c = await asyncio.gather(task_b, burst, task_c)
+    finally:
+        await fins.disconnect()
+        responder.close()
+
+    return response_b, burst_responses, response_c
+
+
+def test_burst_waits_for_service_ids_claimed_while_waiting():
+    """The burst must not register SID 1 while C still owns it."""
+    response_b, burst_responses, response_c = asyncio.run(_burst_during_in_flight_requests())
+
+    assert response_b[14:] == b'\x1eB'
+    assert [response[14:] for response in burst_responses] == [b'\x14X', b'\x14Y']
+    assert response_c[14:] == b'\x1eC'
+
+
+async def _wait_on_sid_across_socket_error():
+    loop = asyncio.get_running_loop()
+    responder, _ = await loop.create_datagram_endpoint(DelayedEchoResponder, local_addr=("127.0.0.1", 0))
+    port = responder.get_extra_info('sockname')[1]
+
+    fins = FinsUdpConnection("127.0.0.1", port=port, timeout=1)
+    await fins.connect()
+    try:
+        def frame(text):
+            return fins.fins_command_frame(command_code=b'\x01\x01', text=text, service_id=b'\x05')
+
+        # A holds SID 5, B waits for it
+        task_a = asyncio.create_task(fins._raw_request(frame(b'\x1eA')))
+        await asyncio.sleep(0.01)
+        task_b = asyncio.create_task(fins._raw_request(frame(b'\x14B')))
+        await asyncio.sleep(0.04)
+        # A socket error fails A; B must then send and be answered through the same pending dict
+        fins.protocol.error_received(ConnectionRefusedError())
+
+        return await asyncio.gather(task_a, task_b, return_exceptions=True)
+    finally:
+        await fins.disconnect()
+        responder.close()
+
+
+def test_request_waiting_on_sid_survives_socket_error():
+    """B, waiting on A's SID when A fails, still gets its own response."""
+    outcome_a, outcome_b = asyncio.run(_wait_on_sid_across_socket_error())
+
+    assert isinstance(outcome_a, ConnectionRefusedError)
+    assert outcome_b[14:] == b'\x14B'
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -7,17 +7,31 @@ You can modify the PLC_IP variable below to match your PLC's IP address.
 """
 
 import asyncio
+import functools
+import re
+import struct
 import sys
+import time
 from datetime import datetime
 
+try:
+    import numpy as np  # Optional - vectorized decode of multiple read responses
+except ImportError:
+    np = None
+
+try:
+    import uvloop  # Optional - faster event loop for the UDP round-trips
+except ImportError:
+    uvloop = None
+
 # Import the FINS protocol components
 from OMRON_FINS_PROTOCOL.Infrastructure.udp_connection import FinsUdpConnection
 from OMRON_FINS_PROTOCOL.Fins_domain.mem_address_parser import FinsAddressParser
+from OMRON_FINS_PROTOCOL.Fins_domain.command_codes import FinsCommandCode
 from OMRON_FINS_PROTOCOL.components.conversion import (
     toInt16, toUInt16, toInt32, toUInt32, toFloat, 
     WordToHex, WordToBin, bcd_to_decimal
 )
-from OMRON_FINS_PROTOCOL.Fins_domain.frames import FinsResponseFrame
 from OMRON_FINS_PROTOCOL.exception.exception_rules import (
     FinsConnectionError, FinsTimeoutError, FinsAddressError
 )
@@ -73,48 +87,87 @@ MULTIPLE_READ_ADDRESSES = {
 }
 
 
+# Print raw frames, hex breakdowns and connection debug logs - the test functions
+# show these frame/hex diagnostics only when the connection is in debug mode
+DEBUG_OUTPUT = False
+
 # Batch read test
 BATCH_START_ADDRESS = "D200"
 BATCH_READ_COUNT = 5
 
+# Reusable MEMORY_AREA_READ command data buffer - the frame built from it is a copy,
+# so it can be refilled for the next read as soon as the frame exists
+COMMAND_SCRATCH = bytearray(8)
+
+# 4-byte MULTIPLE_MEMORY_AREA_READ (0x0104) record per address:
+# Memory area code (1 byte) + Address (2 bytes) + Bit position (1 byte)
+MULTI_READ_RECORD = struct.Struct('>BHB')
+
+# Fixed FINS response layout: header (10 bytes) + command code (2 bytes) + end code (2 bytes) + data
+RESPONSE_HEADER = struct.Struct('>10s2s2s')
+
+# Word decoder per data type for MULTIPLE_MEMORY_AREA_READ values (anything else decodes as INT16)
+MULTI_READ_DECODERS = {"INT16": toInt16, "UINT16": toUInt16}
+
 # =============================================================================
 # TEST FUNCTIONS
 # =============================================================================
 
+# Shared address parser and command codes - neither holds per-call state
+ADDRESS_PARSER = FinsAddressParser()
+COMMAND_CODES = FinsCommandCode()
+
+@functools.lru_cache(maxsize=512)
+def _parse_addr(address):
+    """
+    Parse a PLC address once; repeated rounds reuse the cached result.
+    The returned dict is shared between callers and must not be modified.
+    """
+    return ADDRESS_PARSER.parse(address)
+
+def parse_response(response):
+    """
+    Split a FINS response into (command_code, end_code, data) without building a frame object.
+    The data is a memoryview into the response - no copy is made.
+    """
+    _, command_code, end_code = RESPONSE_HEADER.unpack_from(response)
+    return command_code, end_code, memoryview(response)[RESPONSE_HEADER.size:]
+
 async def test_cpu_details(fins):
     """Test CPU unit details read - simplest command to verify connection"""
     print("🔍 Testing CPU Unit Details Read")
     print("=" * 50)
     
     try:
-        command_codes = fins.command_codes
         
         # Build command frame for CPU details
         command_frame = fins.fins_command_frame(
-            command_code=command_codes.CPU_UNIT_DATA_READ,
+            command_code=COMMAND_CODES.CPU_UNIT_DATA_READ,
             service_id=b'\x00'
         )
         
-        print(f"📤 Sending command frame: {command_frame.hex()}")
+        if fins.debug:
+            print(f"📤 Sending command frame: {command_frame.hex()}")
         
         # Execute the command frame directly
         response = await fins.execute_fins_command_frame(command_frame)
-        print(f"📥 Raw response ({len(response)} bytes): {response.hex()}")
+        if fins.debug:
+            print(f"📥 Raw response ({len(response)} bytes): {response.hex()}")
         
         # Parse response manually
-        response_frame = FinsResponseFrame()
-        response_frame.from_bytes(response)
-        
-        print(f"🔗 Header: {response[:10].hex()}")
-        print(f"📋 Command code: {response_frame.command_code.hex()}")
-        print(f"⚡ End code: {response_frame.end_code.hex()}")
-        
-        if response_frame.end_code == b'\x00\x00':
-            data = response_frame.text
-            unit_name = data[0:20].decode().strip()
-            boot_version = data[20:25].decode().strip()
-            model_number = data[28:32].decode().strip()
-            os_version = data[32:37].decode().strip()
+        command_code, end_code, payload = parse_response(response)
+        
+        if fins.debug:
+            print(f"🔗 Header: {response[:10].hex()}")
+            print(f"📋 Command code: {command_code.hex()}")
+            print(f"⚡ End code: {end_code.hex()}")
+        
+        if end_code == b'\x00\x00':
+            data = payload
+            unit_name = data[0:20].tobytes().decode().strip()
+            boot_version = data[20:25].tobytes().decode().strip()
+            model_number = data[28:32].tobytes().decode().strip()
+            os_version = data[32:37].tobytes().decode().strip()
             
             print("✅ SUCCESS - CPU Details:")
             print(f"   📟 Unit Name: {unit_name}")
@@ -123,7 +176,7 @@ async def test_cpu_details(fins):
             print(f"   💻 OS Version: {os_version}")
             return True
         else:
-            print(f"❌ ERROR - End code: {response_frame.end_code.hex()}")
+            print(f"❌ ERROR - End code: {end_code.hex()}")
             return False
             
     except Exception as e:
@@ -138,22 +191,22 @@ async def test_cpu_status(fins):
     print("=" * 50)
     
     try:
-        command_codes = fins.command_codes
         
         command_frame = fins.fins_command_frame(
-            command_code=command_codes.CPU_UNIT_STATUS_READ,
+            command_code=COMMAND_CODES.CPU_UNIT_STATUS_READ,
             service_id=b'\x00'
         )
         
-        print(f"📤 Sending command frame: {command_frame.hex()}")
+        if fins.debug:
+            print(f"📤 Sending command frame: {command_frame.hex()}")
         
         response = await fins.execute_fins_command_frame(command_frame)
-        print(f"📥 Raw response: {response.hex()}")
+        if fins.debug:
+            print(f"📥 Raw response: {response.hex()}")
         
-        response_frame = FinsResponseFrame()
-        response_frame.from_bytes(response)
+        command_code, end_code, payload = parse_response(response)
         
-        if response_frame.end_code == b'\x00\x00':
+        if end_code == b'\x00\x00':
             # Status and mode mapping
             status_map = {b'\x00': 'Stop', b'\x01': 'Run', b'\x80': 'CPU on standby'}
             mode_map = {b'\x00': 'PROGRAM', b'\x02': 'MONITOR', b'\x04': 'RUN'}
@@ -166,7 +219,7 @@ async def test_cpu_status(fins):
             print(f"   🎮 Mode: {mode_map.get(mode_byte, 'Unknown')}")
             return True
         else:
-            print(f"❌ ERROR - End code: {response_frame.end_code.hex()}")
+            print(f"❌ ERROR - End code: {end_code.hex()}")
             return False
             
     except Exception as e:
@@ -181,25 +234,24 @@ async def test_single_memory_read(fins, address, data_type):
     print("=" * 50)
     
     try:
-        address_parser = FinsAddressParser()
-        command_codes = fins.command_codes
         
         # Parse address to FINS format
-        addr_info = address_parser.parse(address)
-        print(f"🎯 Parsed address info:")
-        print(f"   📍 Memory Area: {addr_info['memory_area']}")
-        print(f"   🔢 Memory Type Code: 0x{addr_info['memory_type_code']:02X}")
-        print(f"   📊 Word Address: {addr_info['word_address']}")
-        print(f"   🔗 Offset Bytes: {addr_info['offset_bytes']}")
+        addr_info = _parse_addr(address)
+        if fins.debug:
+            print(f"🎯 Parsed address info:")
+            print(f"   📍 Memory Area: {addr_info['memory_area']}")
+            print(f"   🔢 Memory Type Code: 0x{addr_info['memory_type_code']:02X}")
+            print(f"   📊 Word Address: {addr_info['word_address']}")
+            print(f"   🔗 Offset Bytes: {addr_info['offset_bytes']}")
         
         # Determine read size based on data type
         read_size = 2 if data_type == "FLOAT" else 1  # FLOAT needs 2 words
         
-        # Build command data
-        command_data = bytearray(8)
-        command_data[0:2] = command_codes.MEMORY_AREA_READ
+        # Build command data in the reusable scratch buffer
+        command_data = COMMAND_SCRATCH
+        command_data[0:2] = COMMAND_CODES.MEMORY_AREA_READ
         command_data[2] = addr_info['memory_type_code']
-        command_data[3:5] = bytes(addr_info['offset_bytes'])
+        command_data[3:5] = addr_info['offset_bytes']
         command_data[5] = addr_info['bit_number'] if addr_info['bit_number'] else 0
         command_data[6:8] = read_size.to_bytes(2, 'big')
         
@@ -209,18 +261,20 @@ async def test_single_memory_read(fins, address, data_type):
             service_id=b'\x00'
         )
         
-        print(f"📤 Command frame: {command_frame.hex()}")
+        if fins.debug:
+            print(f"📤 Command frame: {command_frame.hex()}")
         
         response = await fins.execute_fins_command_frame(command_frame)
-        print(f"📥 Raw response: {response.hex()}")
+        if fins.debug:
+            print(f"📥 Raw response: {response.hex()}")
         
         # Parse response
-        response_frame = FinsResponseFrame()
-        response_frame.from_bytes(response)
+        command_code, end_code, payload = parse_response(response)
         
-        if response_frame.end_code == b'\x00\x00':
-            raw_data = response_frame.text
-            print(f"📦 Raw data: {raw_data.hex()}")
+        if end_code == b'\x00\x00':
+            raw_data = payload
+            if fins.debug:
+                print(f"📦 Raw data: {raw_data.hex()}")
             
             # Convert data based on type
             print("🔄 Converted values:")
@@ -235,13 +289,12 @@ async def test_single_memory_read(fins, address, data_type):
                 print(f"   📈 FLOAT: {value}")
             
             # Show additional formats
-            hex_value = WordToHex(raw_data[:2])[0]
-            print(f"   🔢 HEX: {hex_value}")
+            print(f"   🔢 HEX: {WordToHex(raw_data[:2])[0]}")
             
             print("✅ SUCCESS")
             return True
         else:
-            print(f"❌ ERROR - End code: {response_frame.end_code.hex()}")
+            print(f"❌ ERROR - End code: {end_code.hex()}")
             return False
             
     except Exception as e:
@@ -256,18 +309,16 @@ async def test_batch_memory_read(fins, start_address, count):
     print("=" * 50)
     
     try:
-        address_parser = FinsAddressParser()
-        command_codes = fins.command_codes
         
         # Parse starting address
-        addr_info = address_parser.parse(start_address)
+        addr_info = _parse_addr(start_address)
         print(f"🎯 Starting at: {addr_info['memory_area']} word {addr_info['word_address']}")
         
-        # Build command for batch read
-        command_data = bytearray(8)
-        command_data[0:2] = command_codes.MEMORY_AREA_READ
+        # Build command for batch read in the reusable scratch buffer
+        command_data = COMMAND_SCRATCH
+        command_data[0:2] = COMMAND_CODES.MEMORY_AREA_READ
         command_data[2] = addr_info['memory_type_code']
-        command_data[3:5] = bytes(addr_info['offset_bytes'])
+        command_data[3:5] = addr_info['offset_bytes']
         command_data[5] = 0  # No bit for word reads
         command_data[6:8] = count.to_bytes(2, 'big')
         
@@ -276,28 +327,30 @@ async def test_batch_memory_read(fins, start_address, count):
             service_id=b'\x00'
         )
         
-        print(f"📤 Command frame: {command_frame.hex()}")
+        if fins.debug:
+            print(f"📤 Command frame: {command_frame.hex()}")
         
         response = await fins.execute_fins_command_frame(command_frame)
-        response_frame = FinsResponseFrame()
-        response_frame.from_bytes(response)
+        command_code, end_code, payload = parse_response(response)
         
-        if response_frame.end_code == b'\x00\x00':
-            raw_data = response_frame.text
+        if end_code == b'\x00\x00':
+            raw_data = payload
             values = toInt16(raw_data)
             
-            print(f"📦 Raw data ({len(raw_data)} bytes): {raw_data.hex()}")
+            if fins.debug:
+                print(f"📦 Raw data ({len(raw_data)} bytes): {raw_data.hex()}")
             print(f"✅ SUCCESS - Read {len(values)} values:")
             
+            # Split e.g. "D200" / "CIO100" into area prefix and word number once
+            addr_prefix, addr_digits = re.match(r'([A-Za-z]*)(\d+)', start_address).groups()
+            addr_num = int(addr_digits)
             for i, value in enumerate(values):
-                addr_prefix = start_address[0] if start_address[0].isalpha() else ""
-                addr_num = int(start_address[1:] if start_address[0].isalpha() else start_address)
                 current_addr = f"{addr_prefix}{addr_num + i}"
                 print(f"   📊 {current_addr}: {value} (0x{value & 0xFFFF:04X})")
             
             return True
         else:
-            print(f"❌ ERROR - End code: {response_frame.end_code.hex()}")
+            print(f"❌ ERROR - End code: {end_code.hex()}")
             return False
             
     except Exception as e:
@@ -306,90 +359,130 @@ async def test_batch_memory_read(fins, start_address, count):
     finally:
         print()
 
-async def test_multiple_memory_read(fins, addresses_dict):
+@functools.lru_cache(maxsize=32)
+def _build_multi_read_payload(addresses_tuple):
+    """
+    Parse the addresses of a multiple read once and build its command data.
+    Cached by the (address, data_type) tuple, so repeated rounds over the same
+    addresses skip the parsing. Returns (data_part, address_infos) where
+    address_infos holds (address, memory_area, memory_type_code, word_address,
+    offset_bytes) per address.
+    """
+    record_size = MULTI_READ_RECORD.size
+    data_part = bytearray(len(addresses_tuple) * record_size)  # Preallocated, filled in place
+    address_infos = []
+    
+    for i, (address, _) in enumerate(addresses_tuple):
+        addr_info = _parse_addr(address)
+        
+        # Pack the 4-byte record for each address (0x00 bit position for word access)
+        MULTI_READ_RECORD.pack_into(data_part, i * record_size,
+                                    addr_info['memory_type_code'], addr_info['word_address'], 0x00)
+        
+        address_infos.append((
+            address, addr_info['memory_area'], addr_info['memory_type_code'],
+            addr_info['word_address'], tuple(addr_info['offset_bytes'])
+        ))
+    
+    return bytes(data_part), tuple(address_infos)
+
+async def test_multiple_memory_read(fins, addresses_dict, service_id=None, response=None):
     """
     Test multiple memory areas read in one command using FINS command 0x0104
     Format: CommandCode(0x0104) + NumberOfAreas(2bytes) + [AreaCode+Address+BitPos](4bytes each)
+    A distinct service_id (allocated from the connection if not given) lets several
+    calls run concurrently on the same connection. A response already received
+    for this service_id (e.g. from a burst send) is decoded without sending again.
     """
     print(f"📋 Testing Multiple Memory Areas Read ({len(addresses_dict)} addresses)")
     print("=" * 50)
     
     try:
-        address_parser = FinsAddressParser()
-        command_codes = fins.command_codes
-        
-        # Build command data for multiple read
-        addresses = list(addresses_dict.keys())
         
-        print("🔧 Building MULTIPLE_MEMORY_AREA_READ command (0x0104):")
-        print(f"   📊 Number of addresses to read: {len(addresses)}")
+        # Build command data for multiple read (parsed once per address set)
+        data_part, address_infos = _build_multi_read_payload(tuple(addresses_dict.items()))
         
-        data_part = bytearray()
-        hex_parts = []  # To show the hex breakdown clearly
-        
-        print("🎯 Reading addresses:")
-        for i, address in enumerate(addresses):
-            addr_info = address_parser.parse(address)
-            print(f"   📍 [{i+1}] {address}: {addr_info['memory_area']}")
-            print(f"       🔢 Memory Type Code: 0x{addr_info['memory_type_code']:02X}")
-            print(f"       📊 Word Address: {addr_info['word_address']}")
-            print(f"       🔗 Offset Bytes: {addr_info['offset_bytes']}")
+        if fins.debug:
+            print("🔧 Building MULTIPLE_MEMORY_AREA_READ command (0x0104):")
+            print(f"   📊 Number of addresses to read: {len(address_infos)}")
             
-            # Build 4-byte structure for each address:
-            # Byte 1: Memory area code
-            # Bytes 2-3: Address (2 bytes)
-            # Byte 4: Bit position (0x00 for word access)
-            area_data = bytearray(4)
-            area_data[0] = addr_info['memory_type_code']      # Area code (1 byte)
-            area_data[1:3] = bytes(addr_info['offset_bytes']) # Address (2 bytes)
-            area_data[3] = 0x00                               # Bit position (1 byte)
+            hex_records = []  # (address, 4-byte record hex) for the breakdown below
             
-            area_hex = area_data.hex().upper()
-            print(f"       📦 {address} -> 4 bytes: {area_hex}")
-            hex_parts.append(f"{address}({area_hex})")
-            data_part += area_data
-        
-        print()
-        print("🔥 HEX BREAKDOWN:")
-        print(f"   🎯 Command Format: 0104 + {' + '.join([part.split('(')[0] for part in hex_parts])}")
-        print(f"   🔧 Command Code (0x0104): 0104")
-        for part in hex_parts:
-            addr, hex_val = part.split('(')
-            hex_val = hex_val.rstrip(')')
-            print(f"   📦 {addr}: {hex_val}")
-        print(f"   ✨ Final Hex Pattern: 0104{data_part.hex().upper()}")
-        print(f"   🔧 Complete data part ({len(data_part)} bytes): {data_part.hex().upper()}")
+            print("🎯 Reading addresses:")
+            for i, (address, memory_area, memory_type_code, word_address, offset_bytes) in enumerate(address_infos):
+                print(f"   📍 [{i+1}] {address}: {memory_area}")
+                print(f"       🔢 Memory Type Code: 0x{memory_type_code:02X}")
+                print(f"       📊 Word Address: {word_address}")
+                print(f"       🔗 Offset Bytes: {list(offset_bytes)}")
+                
+                area_hex = data_part[i * 4:i * 4 + 4].hex().upper()
+                print(f"       📦 {address} -> 4 bytes: {area_hex}")
+                hex_records.append((address, area_hex))
+            
+            # Assemble the whole breakdown and write it with a single print
+            data_hex = data_part.hex().upper()
+            print("\n".join([
+                "",
+                "🔥 HEX BREAKDOWN:",
+                f"   🎯 Command Format: 0104 + {' + '.join(address for address, _ in hex_records)}",
+                "   🔧 Command Code (0x0104): 0104",
+                *(f"   📦 {address}: {area_hex}" for address, area_hex in hex_records),
+                f"   ✨ Final Hex Pattern: 0104{data_hex}",
+                f"   🔧 Complete data part ({len(data_part)} bytes): {data_hex}",
+            ]))
         
         # Build FINS command frame with 0x0104 command code
         command_frame = fins.fins_command_frame(
-            command_code=command_codes.MULTIPLE_MEMORY_AREA_READ,  # 0x0104
+            command_code=COMMAND_CODES.MULTIPLE_MEMORY_AREA_READ,  # 0x0104
             text=data_part,
-            service_id=b'\x00'
+            service_id=service_id or fins.next_service_id()
         )
         
-        print(f"📤 Complete command frame: {command_frame.hex()}")
-        print(f"   🔧 Header (10 bytes): {command_frame[:10].hex()}")
-        print(f"   📋 Command code (2 bytes): {command_frame[10:12].hex()}")
-        print(f"   📦 Data part ({len(data_part)} bytes): {command_frame[12:].hex()}")
-        
-        response = await fins.execute_fins_command_frame(command_frame)
-        response_frame = FinsResponseFrame()
-        response_frame.from_bytes(response)
-        
-        print(f"📥 Raw response: {response.hex()}")
-        print(f"   🔧 Response header: {response[:10].hex()}")
-        print(f"   📋 Response command: {response[10:12].hex()}")
-        print(f"   ⚡ End code: {response[12:14].hex()}")
-        print(f"   📦 Response data: {response[14:].hex()}")
-        
-        if response_frame.end_code == b'\x00\x00':
-            raw_data = response_frame.text
+        if fins.debug:
+            print(f"📤 Complete command frame: {command_frame.hex()}")
+            print(f"   🔧 Header (10 bytes): {command_frame[:10].hex()}")
+            print(f"   📋 Command code (2 bytes): {command_frame[10:12].hex()}")
+            print(f"   📦 Data part ({len(data_part)} bytes): {command_frame[12:].hex()}")
+        
+        if response is None:
+            response = await fins.execute_fins_command_frame(command_frame)
+        command_code, end_code, payload = parse_response(response)
+        
+        if fins.debug:
+            print(f"📥 Raw response: {response.hex()}")
+            print(f"   🔧 Response header: {response[:10].hex()}")
+            print(f"   📋 Response command: {response[10:12].hex()}")
+            print(f"   ⚡ End code: {response[12:14].hex()}")
+            print(f"   📦 Response data: {response[14:].hex()}")
+        
+        if end_code == b'\x00\x00':
+            raw_data = payload
             print("✅ SUCCESS - Values read:")
-            print(f"📦 Response format analysis:")
-            print(f"   🔍 Total response data: {raw_data.hex().upper()} ({len(raw_data)} bytes)")
+            if fins.debug:
+                print(f"📦 Response format analysis:")
+                print(f"   🔍 Total response data: {raw_data.hex().upper()} ({len(raw_data)} bytes)")
             
-            # Parse each address: 1 status byte + 2 data bytes (3 bytes total per address)
-            for i, (address, data_type) in enumerate(addresses_dict.items()):
+            # Decode every data word up front: 1 status byte + 2 data bytes (3 bytes total per address)
+            count = len(addresses_dict)
+            if np is not None:
+                # One vectorized big-endian view over the data columns of the (N, 3) records
+                words = np.frombuffer(raw_data, dtype=np.uint8, count=count * 3).reshape(count, 3)[:, 1:3].copy()
+                decoded = {"INT16": words.view('>i2').ravel().tolist(), "UINT16": words.view('>u2').ravel().tolist()}
+                int16_values = decoded["INT16"]
+                values = [decoded.get(data_type, int16_values)[i] for i, data_type in enumerate(addresses_dict.values())]
+            else:
+                # Decode with the data type's converter looked up once per address (default INT16)
+                values = [MULTI_READ_DECODERS.get(data_type, toInt16)(raw_data[i * 3 + 1:i * 3 + 3])[0]
+                          for i, data_type in enumerate(addresses_dict.values())]
+            
+            # Report each address
+            for i, (address, value) in enumerate(zip(addresses_dict, values)):
+                hex_val = f"{value & 0xFFFF:04X}"  # Same 4-digit format as WordToHex
+                
+                if not fins.debug:
+                    print(f"   📊 {address}: {value} (0x{hex_val})")
+                    continue
+                
                 start_idx = i * 3  # Each address takes 3 bytes: 1 status + 2 data
                 
                 # Extract status byte and data bytes
@@ -400,21 +493,12 @@ async def test_multiple_memory_read(fins, addresses_dict):
                 print(f"       📍 Byte position: {start_idx}-{start_idx + 2}")
                 print(f"       🚦 Status byte: {status_byte.hex().upper()} (area code: 0x{status_byte[0]:02X})")
                 print(f"       📦 Data bytes: {value_bytes.hex().upper()}")
-                
-                if data_type == "INT16":
-                    value = toInt16(value_bytes)[0]
-                elif data_type == "UINT16":
-                    value = toUInt16(value_bytes)[0]
-                else:
-                    value = toInt16(value_bytes)[0]  # Default to INT16
-                
-                hex_val = WordToHex(value_bytes)[0]
                 print(f"       📊 Final value: {value} (0x{hex_val})")
                 print(f"   📊 {address}: {value} (0x{hex_val}) [status: {status_byte.hex()}, data: {value_bytes.hex()}]")
             
             return True
         else:
-            print(f"❌ ERROR - End code: {response_frame.end_code.hex()}")
+            print(f"❌ ERROR - End code: {end_code.hex()}")
             return False
             
     except Exception as e:
@@ -436,7 +520,7 @@ async def main():
     try:
         # Initialize connection
         print("🔌 Initializing FINS UDP Connection...")
-        fins = FinsUdpConnection(PLC_IP, debug=True)
+        fins = FinsUdpConnection(PLC_IP, debug=DEBUG_OUTPUT)
         await fins.connect()
         print("✅ Connection initialized successfully")
         print()
@@ -468,24 +552,22 @@ async def main():
         
         # # Test 5: Multiple memory read - D100,D150,D200,D250,D300,D350,D400,D450,D500
         # total_tests += 1
-        starttime = datetime.now()
-        #round1
-        if await test_multiple_memory_read(fins, MULTIPLE_READ_ADDRESSES):
-            tests_passed += 1
-        #round2 
-        if await test_multiple_memory_read(fins, MULTIPLE_READ_ADDRESSES):
-            tests_passed += 1
-        #round3 
-        if await test_multiple_memory_read(fins, MULTIPLE_READ_ADDRESSES):
-            tests_passed += 1
-        #round4 
-        if await test_multiple_memory_read(fins, MULTIPLE_READ_ADDRESSES):
-            tests_passed += 1
-        # #round5 
-        # if await test_multiple_memory_read(fins, MULTIPLE_READ_ADDRESSES):
-        #     tests_passed += 1 
-        endtime = datetime.now()
-        print(f"=====Total time to execute{(endtime - starttime).total_seconds()} =======") 
+        starttime = time.perf_counter_ns()  # Monotonic, immune to wall-clock jumps
+        # rounds 1-4 are sent as one burst before any response is awaited - each
+        # round gets its own service ID so the responses are matched back to it
+        round_ids = [bytes([round_number]) for round_number in range(1, 5)]
+        data_part, _ = _build_multi_read_payload(tuple(MULTIPLE_READ_ADDRESSES.items()))
+        frames = [
+            fins.fins_command_frame(command_code=COMMAND_CODES.MULTIPLE_MEMORY_AREA_READ,
+                                    text=data_part, service_id=round_id)
+            for round_id in round_ids
+        ]
+        responses = await fins.execute_fins_command_frames(frames)
+        for round_id, response in zip(round_ids, responses):
+            tests_passed += await test_multiple_memory_read(
+                fins, MULTIPLE_READ_ADDRESSES, service_id=round_id, response=response)
+        endtime = time.perf_counter_ns()
+        print(f"=====Total time to execute{(endtime - starttime) / 1e9:.6f} =======")
         # # Summary
         # print("📊 TEST SUMMARY")
         # print("=" * 60)
@@ -527,6 +609,9 @@ if __name__ == "__main__":
     print("Press Ctrl+C to interrupt")
     print()
     
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -225,7 +225,7 @@ async def test_single_memory_read(fins, address, data_type):
         command_data = bytearray(8)
         command_data[0:2] = command_codes.MEMORY_AREA_READ
         command_data[2] = addr_info['memory_type_code']
-        command_data[3:5] = bytes(addr_info['offset_bytes'])
+        command_data[3:5] = addr_info['offset_bytes']
         command_data[5] = addr_info['bit_number'] if addr_info['bit_number'] else 0
         command_data[6:8] = read_size.to_bytes(2, 'big')
         
@@ -293,7 +293,7 @@ async def test_batch_memory_read(fins, start_address, count):
         command_data = bytearray(8)
         command_data[0:2] = command_codes.MEMORY_AREA_READ
         command_data[2] = addr_info['memory_type_code']
-        command_data[3:5] = bytes(addr_info['offset_bytes'])
+        command_data[3:5] = addr_info['offset_bytes']
         command_data[5] = 0  # No bit for word reads
         command_data[6:8] = count.to_bytes(2, 'big')
         
@@ -367,7 +367,7 @@ async def test_multiple_memory_read(fins, addresses_dict):
             # Byte 4: Bit position (0x00 for word access)
             area_data = bytearray(4)
             area_data[0] = addr_info['memory_type_code']      # Area code (1 byte)
-            area_data[1:3] = bytes(addr_info['offset_bytes']) # Address (2 bytes)
+            area_data[1:3] = addr_info['offset_bytes'] # Address (2 bytes)
             area_data[3] = 0x00                               # Bit position (1 byte)
             
             area_hex = area_data.hex().upper()
@@ -8,6 +8,9 @@ from datetime import datetime
 from OMRON_FINS_PROTOCOL.Infrastructure.udp_connection import FinsUdpConnection
 from OMRON_FINS_PROTOCOL.components.data_type_mapping import DATA_TYPE_MAPPING
 
+# Data types read as plain 1-word INT16 values
+_NORMALIZE_TO_INT16 = frozenset(('BOOL', 'CHANNEL'))
+
 # Mock PLC configuration for testing
 MOCK_PLC_CONFIG = {
     'plc_name': 'TestPLC',
@@ -40,9 +43,9 @@ class MockPLCTask:
         self.multiple_read_groups = []
         self.single_read_addresses = []
         
-        # Filter out HEARTBEAT and separate by word size
-        one_word_mappings = []
-        multi_word_mappings = []
+        # Single pass: skip HEARTBEAT, fill 1-word groups as we go, collect multi-word singles
+        batch_size = 20  # Max addresses per multiple_read group
+        current_group = None
         
         for mapping in self.address_mappings:
             plc_address = mapping['plc_reg_add']
@@ -54,46 +57,32 @@ class MockPLCTask:
             data_type = mapping.get('data_type', 'int16').upper()
             
             # Normalize data types
-            if data_type in ['BOOL', 'CHANNEL']:
+            if data_type in _NORMALIZE_TO_INT16:
                 data_type = 'INT16'
             
+            item = {
+                'plc_reg': plc_address,
+                'opcua_reg': mapping['opcua_reg_add'],
+                'data_type': data_type,
+                'original_mapping': mapping
+            }
+            
             # Check if data type exists in mapping and get word size
             if data_type in DATA_TYPE_MAPPING:
                 words_per_item, _ = DATA_TYPE_MAPPING[data_type]
                 
                 if words_per_item == 1:
-                    # 1-word data type - add to multiple read groups
-                    one_word_mappings.append({
-                        'plc_reg': plc_address,
-                        'opcua_reg': mapping['opcua_reg_add'],
-                        'data_type': data_type,
-                        'original_mapping': mapping
-                    })
+                    # 1-word data type - add to the open multiple read group, starting a new one when full
+                    if current_group is None or len(current_group) == batch_size:
+                        current_group = []
+                        self.multiple_read_groups.append(current_group)
+                    current_group.append(item)
                 else:
                     # Multi-word data type - add to single read list
-                    multi_word_mappings.append({
-                        'plc_reg': plc_address,
-                        'opcua_reg': mapping['opcua_reg_add'],
-                        'data_type': data_type,
-                        'original_mapping': mapping
-                    })
+                    self.single_read_addresses.append(item)
             else:
                 print(f"Unknown data type '{data_type}' for address {plc_address}, treating as single read")
-                multi_word_mappings.append({
-                    'plc_reg': plc_address,
-                    'opcua_reg': mapping['opcua_reg_add'],
-                    'data_type': data_type,
-                    'original_mapping': mapping
-                })
-        
-        # Group 1-word addresses in batches of 20 for multiple_read
-        batch_size = 20
-        for i in range(0, len(one_word_mappings), batch_size):
-            batch = one_word_mappings[i:i + batch_size]
-            self.multiple_read_groups.append(batch)
-        
-        # Store multi-word addresses for individual reads
-        self.single_read_addresses = multi_word_mappings
+                self.single_read_addresses.append(item)
         
         print(f"Address grouping initialized:")
         print(f"  - Multiple read groups: {len(self.multiple_read_groups)} (max 20 addresses each)")
@@ -1,89 +1,106 @@
 #!/usr/bin/env python3
 """
 Test script to verify the refactored data type mapping imports work correctly.
+
+Run with `pytest test_refactored_imports.py` or directly as a script.
 """
 
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Imported once at module level - an ImportError fails collection and pytest reports it
+from OMRON_FINS_PROTOCOL.components.data_type_mapping import DATA_TYPE_MAPPING, return_raw_bytes
+
+# Importing the mapping module also initializes its components package, so the tests
+# below only look both up in sys.modules rather than running the import machinery again
+MAPPING_MODULE = "OMRON_FINS_PROTOCOL.components.data_type_mapping"
+COMPONENTS_PACKAGE = "OMRON_FINS_PROTOCOL.components"
+UDP_CONNECTION_MODULE = "OMRON_FINS_PROTOCOL.Infrastructure.udp_connection"
+
+# Heavy optional packages that importing the UDP connection must not pull in
+HEAVY_OPTIONAL_MODULES = ("numpy", "asyncua", "matplotlib")
+
+# Repository root, so a fresh interpreter started from here finds OMRON_FINS_PROTOCOL
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Expected words per item for each DATA_TYPE_MAPPING entry
+MAPPING_ENTRIES = [
+    ("INT16", 1), ("UINT16", 1), ("INT32", 2), ("UINT32", 2),
+    ("INT64", 4), ("UINT64", 4), ("FLOAT", 2), ("DOUBLE", 4),
+    ("BCD2DEC", 1), ("BOOL", 1), ("CHANNEL", 1), ("WORD", 1),
+    ("UDINT", 2), ("BIN", 1), ("BITS", 1), ("RAW", 1),
+]
+
+@pytest.fixture(scope="module")
+def mapping():
+    """(DATA_TYPE_MAPPING, return_raw_bytes) from the module-level import."""
+    return DATA_TYPE_MAPPING, return_raw_bytes
+
 def test_direct_import():
     """Test importing directly from data_type_mapping module."""
-    try:
-        from OMRON_FINS_PROTOCOL.components.data_type_mapping import DATA_TYPE_MAPPING, return_raw_bytes
-        print("✅ Direct import from data_type_mapping module successful")
-        print(f"   - DATA_TYPE_MAPPING has {len(DATA_TYPE_MAPPING)} entries")
-        print(f"   - return_raw_bytes function: {return_raw_bytes}")
-        return True
-    except ImportError as e:
-        print(f"❌ Direct import failed: {e}")
-        return False
+    module = sys.modules.get(MAPPING_MODULE)
+    assert module is not None, f"{MAPPING_MODULE} not registered in sys.modules"
+    assert getattr(module, 'DATA_TYPE_MAPPING', None) is DATA_TYPE_MAPPING, "DATA_TYPE_MAPPING mismatch"
 
 def test_components_import():
     """Test importing through components package."""
-    try:
-        from OMRON_FINS_PROTOCOL.components import DATA_TYPE_MAPPING, return_raw_bytes
-        print("✅ Import through components package successful")
-        print(f"   - DATA_TYPE_MAPPING has {len(DATA_TYPE_MAPPING)} entries")
-        print(f"   - return_raw_bytes function: {return_raw_bytes}")
-        return True
-    except ImportError as e:
-        print(f"❌ Components package import failed: {e}")
-        return False
-
-def test_functionality():
+    package = sys.modules.get(COMPONENTS_PACKAGE)
+    module = sys.modules[MAPPING_MODULE]
+    # The package must re-export the very same objects as the module it imports them from
+    assert getattr(package, 'DATA_TYPE_MAPPING', None) is module.DATA_TYPE_MAPPING, \
+        "components package does not re-export DATA_TYPE_MAPPING"
+    assert getattr(package, 'return_raw_bytes', None) is module.return_raw_bytes, \
+        "components package does not re-export return_raw_bytes"
+
+def test_functionality(mapping):
     """Test that the function actually works."""
-    try:
-        from OMRON_FINS_PROTOCOL.components.data_type_mapping import return_raw_bytes, DATA_TYPE_MAPPING
-        
-        # Test the function
-        test_data = b'\x12\x34'
-        result = return_raw_bytes(test_data)
-        assert result == test_data, f"Expected {test_data}, got {result}"
-        print("✅ return_raw_bytes function works correctly")
-        
-        # Test mapping structure
-        assert 'INT16' in DATA_TYPE_MAPPING, "INT16 missing from mapping"
-        assert 'RAW' in DATA_TYPE_MAPPING, "RAW missing from mapping"
-        words_per_item, conversion_func = DATA_TYPE_MAPPING['INT16']
-        assert words_per_item == 1, f"Expected 1 word for INT16, got {words_per_item}"
-        assert conversion_func == return_raw_bytes, "Conversion function mismatch"
-        print("✅ DATA_TYPE_MAPPING structure is correct")
-        
-        return True
-    except Exception as e:
-        print(f"❌ Functionality test failed: {e}")
-        return False
+    _, raw_bytes_func = mapping
+
+    # Test the function
+    test_data = b'\x12\x34'
+    result = raw_bytes_func(test_data)
+    assert result == test_data, f"Expected {test_data}, got {result}"
+
+@pytest.mark.parametrize("key,expected_words", MAPPING_ENTRIES)
+def test_mapping_entry(mapping, key, expected_words):
+    """Test one DATA_TYPE_MAPPING entry's word size and conversion function."""
+    data_type_mapping, raw_bytes_func = mapping
+    assert key in data_type_mapping, f"{key} missing from mapping"
+    words_per_item, conversion_func = data_type_mapping[key]
+    assert words_per_item == expected_words, f"Expected {expected_words} word(s) for {key}, got {words_per_item}"
+    assert conversion_func is raw_bytes_func, f"Conversion function mismatch for {key}"
+
+# Run in a fresh interpreter by test_udp_connection_import: registers the module through a
+# LazyLoader (finding and registering it checks the import structure, the module body only
+# runs on the first attribute access), then prints the loaded module names as JSON
+UDP_IMPORT_CHECK = """
+import importlib.util, json, sys
+spec = importlib.util.find_spec(sys.argv[1])
+assert spec is not None, f"{sys.argv[1]} not found"
+spec.loader = importlib.util.LazyLoader(spec.loader)
+module = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = module
+spec.loader.exec_module(module)
+assert hasattr(module, "FinsUdpConnection"), "FinsUdpConnection missing from udp_connection"
+print(json.dumps(sorted(sys.modules)))
+"""
 
 def test_udp_connection_import():
-    """Test that UDP connection can import the mapping."""
-    try:
-        from OMRON_FINS_PROTOCOL.Infrastructure.udp_connection import FinsUdpConnection
-        print("✅ UDP connection imports successfully with new mapping")
-        return True
-    except ImportError as e:
-        print(f"❌ UDP connection import failed: {e}")
-        return False
+    """Test that UDP connection can import the mapping without loading heavy optional packages."""
+    # A fresh interpreter: in this process other test modules may already have loaded
+    # udp_connection or numpy, and the lazy registration can't disturb this process's imports
+    result = subprocess.run(
+        [sys.executable, "-c", UDP_IMPORT_CHECK, UDP_CONNECTION_MODULE],
+        capture_output=True, text=True, cwd=REPO_DIR,
+    )
+    assert result.returncode == 0, f"UDP connection import failed:\n{result.stderr}"
+    loaded = json.loads(result.stdout)
+    eager = [name for name in loaded if name.partition('.')[0] in HEAVY_OPTIONAL_MODULES]
+    assert not eager, f"UDP connection import eagerly loaded: {', '.join(eager)}"
 
 if __name__ == "__main__":
-    print("Testing refactored data type mapping imports...")
-    print("=" * 50)
-    
-    tests = [
-        test_direct_import,
-        test_components_import,
-        test_functionality,
-        test_udp_connection_import,
-    ]
-    
-    passed = 0
-    total = len(tests)
-    
-    for test in tests:
-        if test():
-            passed += 1
-        print()
-    
-    print("=" * 50)
-    print(f"Test Results: {passed}/{total} tests passed")
-    
-    if passed == total:
-        print("🎉 All tests passed! Refactoring successful!")
-    else:
-        print("⚠️  Some tests failed. Check the import structure.")
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-q"]))